@@ -12,20 +12,31 @@
 # https://uo.stratics.com/heptazane/fileformats.shtml  (section 1.2 Colors)
 
 import os
+import mmap
 import struct
-import csv
+import contextlib
+import functools
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python parser
+    np = None
 
 # ---------- Parsing ----------
 
 HUE_ENTRY_STRUCT = "<32HHH20s"  # 32*WORD color table, WORD start, WORD end, 20-byte name (little-endian)
-HUE_ENTRY_SIZE = struct.calcsize(HUE_ENTRY_STRUCT)  # 64 + 2 + 2 + 20 = 88 bytes
+_ENTRY = struct.Struct(HUE_ENTRY_STRUCT)  # compiled once, reused for every entry
+HUE_ENTRY_SIZE = _ENTRY.size  # 64 + 2 + 2 + 20 = 88 bytes
 HUE_GROUP_HEADER_SIZE = 4  # DWORD header per group
 HUES_PER_GROUP = 8
+HUE_GROUP_SIZE = HUE_GROUP_HEADER_SIZE + HUES_PER_GROUP * HUE_ENTRY_SIZE  # 4 + 8*88 = 708 bytes
+MMAP_THRESHOLD = 64 * 1024  # below this a plain read() is as cheap as mapping
 
-def color16_to_rgb888(c16: int):
+def _color16_to_rgb888_calc(c16: int):
     """Convert UO 15-bit color (x RRRRR GGGGG BBBBB) to (R,G,B) 0..255."""
     r5 = (c16 >> 10) & 0x1F
     g5 = (c16 >> 5)  & 0x1F
@@ -36,68 +47,185 @@ def color16_to_rgb888(c16: int):
     b = (b5 * 255) // 31
     return (r, g, b)
 
+def _build_c16_lut():
+    """
+    Full 65536-entry table of 16-bit color -> (R,G,B).
+    With NumPy a (65536, 3) uint8 array; otherwise a list of tuples where
+    c and c | 0x8000 share one tuple, since bit 15 is unused.
+    """
+    if np is None:
+        lut = [_color16_to_rgb888_calc(c) for c in range(0x8000)]
+        return lut + lut
+    idx = np.arange(65536, dtype=np.uint32)
+    lut = np.empty((65536, 3), dtype=np.uint8)
+    lut[:, 0] = (((idx >> 10) & 0x1F) * 255) // 31
+    lut[:, 1] = (((idx >> 5) & 0x1F) * 255) // 31
+    lut[:, 2] = ((idx & 0x1F) * 255) // 31
+    return lut
+
+_C16_LUT = _build_c16_lut()
+
+def color16_to_rgb888(c16: int):
+    """Convert UO 15-bit color (x RRRRR GGGGG BBBBB) to (R,G,B) 0..255."""
+    if np is None:
+        return _C16_LUT[c16]
+    return tuple(_C16_LUT[c16].tolist())
+
+class Hue:
+    """One hue row, as returned by HuesData[i]; colors are views into the columns."""
+    __slots__ = ("index", "name", "start", "end", "colors16", "colorsRGB")
+
+    def __init__(self, index, name, start, end, colors16, colorsRGB):
+        self.index = index
+        self.name = name
+        self.start = start
+        self.end = end
+        self.colors16 = colors16
+        self.colorsRGB = colorsRGB
+
+class HuesData:
+    """
+    All loaded hues as parallel columns (struct-of-arrays), row i is hue i.
+    With NumPy: indices int32[N], starts/ends uint16[N], colors16 uint16[N,32]
+    and rgb uint8[N,32,3]. Without it the same columns are plain lists.
+    names is always a list of str.
+    """
+    __slots__ = ("indices", "names", "starts", "ends", "colors16", "rgb")
+
+    def __init__(self, indices, names, starts, ends, colors16, rgb):
+        self.indices = indices
+        self.names = names
+        self.starts = starts
+        self.ends = ends
+        self.colors16 = colors16
+        self.rgb = rgb
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, i):
+        return Hue(int(self.indices[i]), self.names[i], int(self.starts[i]), int(self.ends[i]),
+                   self.colors16[i], self.rgb[i])
+
 def parse_hues(path):
     """
     Read hues.mul: a stream of HueGroup blocks until EOF.
     Each HueGroup: DWORD header + 8 HueEntry.
     HueEntry: 32 WORD color table, WORD start, WORD end, CHAR[20] name.
-    Returns list of dicts: {index, name, start, end, colors16, colorsRGB}
+    Returns a HuesData; hue indices are 1-based.
+    """
+    if np is not None:
+        return _parse_hues_numpy(path)
+    return _parse_hues_python(path)
+
+@contextlib.contextmanager
+def _open_hues_buffer(path):
+    """
+    Yield the raw bytes of a hues file as a read-only buffer.
+    Files above MMAP_THRESHOLD are memory-mapped so parsing works straight
+    off the page cache; small (or empty) files are simply read.
     """
-    hues = []
-    idx = 1
-    filesize = os.path.getsize(path)
     with open(path, "rb") as f:
-        pos = 0
-        while True:
-            # Read group header
-            hdr = f.read(HUE_GROUP_HEADER_SIZE)
-            pos += len(hdr)
-            if not hdr or len(hdr) < HUE_GROUP_HEADER_SIZE:
-                break  # EOF
-            # Read 8 entries
-            for _ in range(HUES_PER_GROUP):
-                data = f.read(HUE_ENTRY_SIZE)
-                if not data or len(data) < HUE_ENTRY_SIZE:
-                    # graceful stop if file ends unexpectedly
-                    return hues
-                pos += len(data)
-
-                unpacked = struct.unpack(HUE_ENTRY_STRUCT, data)
-                colors16 = list(unpacked[0:32])
-                start = unpacked[32]
-                end   = unpacked[33]
-                rawname = unpacked[34]
-                name = rawname.split(b"\x00", 1)[0].decode("ascii", errors="ignore").strip()
-
-                colorsRGB = [color16_to_rgb888(c) for c in colors16]
-
-                hues.append({
-                    "index": idx,
-                    "name": name,
-                    "start": start,
-                    "end": end,
-                    "colors16": colors16,
-                    "colorsRGB": colorsRGB
-                })
-                idx += 1
-
-            # safety: stop if we somehow overshoot
-            if pos >= filesize:
-                break
-
-    return hues
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+def _entry_stream(data):
+    """
+    Concatenate every complete HueEntry in `data`, skipping the group
+    headers, so the entries can be unpacked as one uniform 88-byte stream.
+    """
+    size = len(data)
+    view = memoryview(data)
+    try:
+        parts = []
+        for group in range(0, size, HUE_GROUP_SIZE):
+            start = group + HUE_GROUP_HEADER_SIZE
+            avail = min(HUES_PER_GROUP * HUE_ENTRY_SIZE, max(size - start, 0))
+            # graceful stop if file ends unexpectedly: keep complete entries only
+            end = start + avail - avail % HUE_ENTRY_SIZE
+            parts.append(view[start:end])
+        return b"".join(parts)
+    finally:
+        parts.clear()
+        view.release()
+
+def _parse_hues_numpy(path):
+    """
+    Vectorized parse: view the whole file as uint8, drop the group headers and
+    map all 32*N color words through _C16_LUT instead of per-entry Python calls.
+    """
+    with _open_hues_buffer(path) as data:
+        buf = np.frombuffer(data, dtype=np.uint8)
+
+        # Full groups, plus whatever complete entries a truncated last group holds
+        n_groups, rem = divmod(len(buf), HUE_GROUP_SIZE)
+        n_tail = max(rem - HUE_GROUP_HEADER_SIZE, 0) // HUE_ENTRY_SIZE
+
+        groups = buf[:n_groups * HUE_GROUP_SIZE].reshape(n_groups, HUE_GROUP_SIZE)
+        entries = groups[:, HUE_GROUP_HEADER_SIZE:].reshape(-1, HUE_ENTRY_SIZE)
+        if n_tail:
+            tail_start = n_groups * HUE_GROUP_SIZE + HUE_GROUP_HEADER_SIZE
+            tail_end = tail_start + n_tail * HUE_ENTRY_SIZE
+            entries = np.concatenate([entries, buf[tail_start:tail_end].reshape(n_tail, HUE_ENTRY_SIZE)])
+
+        # Bytes 0:64 color table, 64:66 start, 66:68 end, 68:88 name.
+        # Everything is copied out so nothing keeps the mapping alive.
+        colors16 = entries[:, 0:64].copy().view("<u2").astype(np.uint16)
+        starts = entries[:, 64:66].copy().view("<u2").ravel()
+        ends = entries[:, 66:68].copy().view("<u2").ravel()
+        rawnames = entries[:, 68:88].copy()
+        del buf, groups, entries
+
+    rgb = _C16_LUT[colors16]  # (N, 32, 3) gather, no per-color arithmetic
+    # Blank everything from the first NUL on; the "S20" view then drops the
+    # padding and all names decode in a single call.
+    rawnames[np.cumsum(rawnames == 0, axis=1) > 0] = 0
+    names = np.char.strip(np.char.decode(rawnames.view("S20").ravel(), "latin-1")).tolist()
+    indices = np.arange(1, len(names) + 1, dtype=np.int32)
+    return HuesData(indices, names, starts, ends, colors16, rgb)
+
+def _parse_hues_python(path):
+    """Pure-Python fallback for parse_hues when NumPy is not installed."""
+    names, starts, ends, colors16, rgb = [], [], [], [], []
+    names_append, starts_append, ends_append = names.append, starts.append, ends.append
+    colors16_append, rgb_append = colors16.append, rgb.append
+    to_rgb = _C16_LUT.__getitem__
+    with _open_hues_buffer(path) as data:
+        stream = _entry_stream(data)
+    for unpacked in _ENTRY.iter_unpack(stream):
+        colors = unpacked[0:32]
+        names_append(unpacked[34].partition(b"\x00")[0].decode("latin-1").strip())
+        starts_append(unpacked[32])
+        ends_append(unpacked[33])
+        colors16_append(list(colors))
+        rgb_append(list(map(to_rgb, colors)))
+
+    indices = list(range(1, len(names) + 1))
+    return HuesData(indices, names, starts, ends, colors16, rgb)
 
 # ---------- GUI Helpers ----------
 
 def make_swatch_image(rgb_list, width=640, height=40):
     """
-    Create a horizontal swatch image from a list of 32 (R,G,B) tuples.
+    Create a horizontal swatch tk.PhotoImage from a list of 32 (R,G,B) tuples.
+    Each color is one solid band filled with a single put(), so no
+    intermediate image or resize is needed.
     """
-    # Base 32x1 strip scaled up for crisp bands
-    base = Image.new("RGB", (32, 1))
-    for i, rgb in enumerate(rgb_list[:32]):
-        base.putpixel((i, 0), rgb)
-    img = base.resize((width, height), resample=Image.NEAREST)
+    if np is not None and isinstance(rgb_list, np.ndarray):
+        rgb_list = rgb_list.tolist()
+    img = tk.PhotoImage(width=width, height=height)
+    for i, (r, g, b) in enumerate(rgb_list[:32]):
+        x0 = i * width // 32
+        x1 = (i + 1) * width // 32
+        if x1 > x0:
+            img.put(f"#{r:02x}{g:02x}{b:02x}", to=(x0, 0, x1, height))
     return img
 
 def format_rgb_list(rgb_list):
@@ -111,8 +239,93 @@ def format_rgb_list(rgb_list):
     chunks = [lines[i:i+8] for i in range(0, len(lines), 8)]
     return "\n\n".join("\n".join(row) for row in chunks)
 
+def hue_labels(hues):
+    """List labels ("   1 — name") for every hue in a HuesData."""
+    indices = hues.indices.tolist() if np is not None and isinstance(hues.indices, np.ndarray) else hues.indices
+    return [f"{idx:4d} — {name or '(no name)'}" for idx, name in zip(indices, hues.names)]
+
+def rgb_text_blocks(hues, labels):
+    """
+    Format every hue's RGB table as one text, each block headed by its label.
+    Returns (text, first_lines): first_lines[i] is the 1-based line where hue
+    i's block starts, plus an end sentinel. Pure Python, safe off the Tk thread.
+    """
+    rgb = hues.rgb.tolist() if np is not None and isinstance(hues.rgb, np.ndarray) else hues.rgb
+    blocks = []
+    first_lines = []
+    line = 1
+    for label, colors in zip(labels, rgb):
+        block = f"{label}\n{format_rgb_list(colors)}\n\n"
+        blocks.append(block)
+        first_lines.append(line)
+        line += block.count("\n")
+    first_lines.append(line)  # end sentinel
+    return "".join(blocks), first_lines
+
+# ---------- Export ----------
+
+CSV_LINE_END = "\r\n"  # csv.writer's default terminator, kept for compatible output
+# index, name, start, end and 96 color components; only the name is a string
+_CSV_ROW_FMT = "%d,%s," + ",".join(["%d"] * 98) + CSV_LINE_END
+
+def csv_header():
+    """index, name, start, end, then 32 RGB triplets flattened."""
+    header = ["index", "name", "start", "end"]
+    for i in range(32):
+        header += [f"c{i}_R", f"c{i}_G", f"c{i}_B"]
+    return header
+
+def csv_rows(hues):
+    """
+    Build all CSV data rows at once from a HuesData. With NumPy the color
+    table is flattened to (N, 96) in one step instead of per-triplet extends.
+    """
+    if np is not None and isinstance(hues.rgb, np.ndarray):
+        indices = hues.indices.tolist()
+        starts = hues.starts.tolist()
+        ends = hues.ends.tolist()
+        flat = hues.rgb.reshape(len(hues), -1).tolist()
+    else:
+        indices, starts, ends = hues.indices, hues.starts, hues.ends
+        flat = [[v for rgb in colors for v in rgb] for colors in hues.rgb]
+    return [[i, n, s, e, *colors] for i, n, s, e, colors in zip(indices, hues.names, starts, ends, flat)]
+
+def _csv_quote(field):
+    """Quote a text field the way csv.QUOTE_MINIMAL does."""
+    if any(ch in field for ch in ',"\r\n'):
+        return '"' + field.replace('"', '""') + '"'
+    return field
+
+def csv_text(hues):
+    """
+    Format the complete CSV with one %-format per row instead of csv.writer;
+    every column except the name is a plain integer.
+    """
+    rows = csv_rows(hues)
+    fmt = _CSV_ROW_FMT
+    lines = [",".join(csv_header()) + CSV_LINE_END]
+    for row in rows:
+        row[1] = _csv_quote(row[1])
+        lines.append(fmt % tuple(row))
+    return "".join(lines)
+
+def write_file_mapped(path, data):
+    """
+    Write `data` (bytes) through a writable mmap: size the file once with
+    ftruncate and copy the whole buffer into the mapping in one go.
+    """
+    with open(path, "w+b") as f:
+        if not data:
+            return
+        os.ftruncate(f.fileno(), len(data))
+        with mmap.mmap(f.fileno(), len(data), access=mmap.ACCESS_WRITE) as mm:
+            mm[:] = data
+            mm.flush()
+
 # ---------- GUI App ----------
 
+RENDER_DELAY_MS = 30  # quiet period before the swatch/RGB table is redrawn
+
 class HuesApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -120,9 +333,21 @@ class HuesApp(tk.Tk):
         self.geometry("1000x640")
         self.minsize(900, 560)
 
-        self.hues = []           # loaded hues
-        self.current_swatch = None
+        self.hues = None         # loaded HuesData
         self.current_swatch_tk = None
+        # (hue index, width) -> PhotoImage; the cache also keeps the images
+        # referenced so Tk does not lose them to garbage collection. It is
+        # cleared whenever the canvas width changes, so in practice it only
+        # holds swatches at the current width (~110 KB each at 700 px).
+        self._get_swatch_tk = functools.lru_cache(maxsize=64)(self._make_swatch_tk)
+        self._swatch_width = None  # canvas width the cached swatches were built for
+        # first line of each hue's block in the pre-filled RGB text widget
+        self._rgb_block_lines = []
+        # parse results come back from the worker thread through this queue
+        self._load_queue = queue.Queue()
+        self._loading = False
+        self._pending_render = None  # after() id of the debounced swatch/text render
+        self._last_render = None     # (hue index, width) currently on screen
 
         self._build_menu()
         self._build_widgets()
@@ -131,6 +356,7 @@ class HuesApp(tk.Tk):
         menubar = tk.Menu(self)
         filemenu = tk.Menu(menubar, tearoff=False)
         filemenu.add_command(label="Open hues.mul…", command=self.open_file)
+        self.filemenu = filemenu  # "Open" is disabled while a load is running
         filemenu.add_separator()
         filemenu.add_command(label="Exit", command=self.destroy)
         menubar.add_cascade(label="File", menu=filemenu)
@@ -170,9 +396,13 @@ class HuesApp(tk.Tk):
         self.lbl_range = ttk.Label(meta, text="Range: —")
         self.lbl_range.pack(side=tk.LEFT)
 
+        # Shown (indeterminate) only while a file is being parsed
+        self.progress = ttk.Progressbar(meta, mode="indeterminate", length=120)
+
         # Swatch
         self.swatch_canvas = tk.Canvas(right, height=60, highlightthickness=1, bg="#333333", highlightbackground="#555555")
         self.swatch_canvas.pack(fill=tk.X, pady=8)
+        self.swatch_canvas.bind("<Configure>", self._schedule_render)
 
         # RGB text area
         rgb_frame = ttk.Frame(right)
@@ -190,6 +420,8 @@ class HuesApp(tk.Tk):
         txt_scroll_x = ttk.Scrollbar(right, orient="horizontal", command=self.txt_rgb.xview)
         txt_scroll_x.pack(fill=tk.X)
         self.txt_rgb.config(xscrollcommand=txt_scroll_x.set)
+        self.txt_rgb.tag_configure("current", background="#fff3c4")
+        self.txt_rgb.config(state="disabled")
 
         # Status
         self.status = ttk.Label(self, text="Open a hues.mul to get started.")
@@ -198,56 +430,133 @@ class HuesApp(tk.Tk):
     # -------- actions --------
 
     def open_file(self):
+        if self._loading:
+            return
         path = filedialog.askopenfilename(
             title="Open hues.mul",
             filetypes=[("UO hues.mul", "hues.mul"), ("All files", "*.*")]
         )
         if not path:
             return
+        self._loading = True
+        self.filemenu.entryconfig(0, state="disabled")
+        self.status.config(text=f"Loading: {path}")
+        self.progress.pack(side=tk.RIGHT)
+        self.progress.start(10)
+        threading.Thread(target=self._parse_worker, args=(path,), daemon=True).start()
+        self.after(50, self._poll_load)
+
+    def _parse_worker(self, path):
+        """
+        Runs off the Tk thread: parse and pre-format the list labels and RGB
+        text, never touch widgets here.
+        """
         try:
             hues = parse_hues(path)
+            labels = hue_labels(hues)
+            text, first_lines = rgb_text_blocks(hues, labels)
+            self._load_queue.put((path, (hues, labels, text, first_lines), None))
+        except Exception as e:
+            self._load_queue.put((path, None, e))
+
+    def _poll_load(self):
+        try:
+            path, result, error = self._load_queue.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_load)
+            return
+        self._loading = False
+        self.filemenu.entryconfig(0, state="normal")
+        self.progress.stop()
+        self.progress.pack_forget()
+        try:
+            if error is not None:
+                raise error
+            hues, labels, text, first_lines = result
             if not hues:
                 raise ValueError("No hues found or file unreadable.")
             self.hues = hues
-            self._populate_list()
+            self._get_swatch_tk.cache_clear()
+            self._last_render = None
+            self._populate_list(labels, text, first_lines)
             self.status.config(text=f"Loaded {len(hues)} hues from: {path}")
         except Exception as e:
+            self.status.config(text=f"Failed to load: {path}")
             messagebox.showerror("Error", f"Failed to read hues.mul:\n{e}")
 
-    def _populate_list(self):
+    def _populate_list(self, labels, text, first_lines):
         self.hue_list.delete(0, tk.END)
-        for h in self.hues:
-            label = f"{h['index']:4d} — {h['name'] or '(no name)'}"
-            self.hue_list.insert(tk.END, label)
+        # one Tcl call for the whole list instead of one per hue
+        self.hue_list.insert(tk.END, *labels)
+        self._fill_rgb_text(text, first_lines)
         if self.hues:
             self.hue_list.selection_clear(0, tk.END)
             self.hue_list.selection_set(0)
             self.hue_list.event_generate("<<ListboxSelect>>")
 
+    def _fill_rgb_text(self, text, first_lines):
+        """
+        Write the pre-formatted RGB tables (see rgb_text_blocks) into the text
+        widget in one insert. Selecting a hue then only moves the "current"
+        tag and scrolls.
+        """
+        self._rgb_block_lines = first_lines
+        self.txt_rgb.config(state="normal")
+        self.txt_rgb.delete("1.0", tk.END)
+        self.txt_rgb.insert("1.0", text)
+        self.txt_rgb.config(state="disabled")
+
     def on_select(self, _evt):
         sel = self.hue_list.curselection()
         if not sel:
             return
-        h = self.hues[sel[0]]
+        i = sel[0]
+        h = self.hues[i]
 
         # Labels
-        self.lbl_index.config(text=f"Index: {h['index']}")
-        self.lbl_name.config(text=f"Name: {h['name'] or '(no name)'}")
-        self.lbl_range.config(text=f"Range: {h['start']}–{h['end']}")
+        self.lbl_index.config(text=f"Index: {h.index}")
+        self.lbl_name.config(text=f"Name: {h.name or '(no name)'}")
+        self.lbl_range.config(text=f"Range: {h.start}–{h.end}")
+
+        # Swatch and RGB table wait until navigation settles
+        self._schedule_render()
+
+    def _schedule_render(self, _evt=None):
+        """Coalesce bursts of selections / canvas resizes into one render."""
+        if self._pending_render is not None:
+            self.after_cancel(self._pending_render)
+        self._pending_render = self.after(RENDER_DELAY_MS, self._render_selection)
+
+    def _render_selection(self):
+        self._pending_render = None
+        sel = self.hue_list.curselection()
+        if not sel or not self.hues:
+            return
+        i = sel[0]
+        width = self.swatch_canvas.winfo_width() or 640
+        if self._last_render == (i, width):
+            return  # same hue at the same size is already displayed
+        self._last_render = (i, width)
+        if width != self._swatch_width:
+            # swatches for other widths will not be shown again; free them
+            self._get_swatch_tk.cache_clear()
+            self._swatch_width = width
 
         # Swatch
-        self.current_swatch = make_swatch_image(h["colorsRGB"], width=self.swatch_canvas.winfo_width() or 640, height=40)
-        self.current_swatch_tk = ImageTk.PhotoImage(self.current_swatch)
+        self.current_swatch_tk = self._get_swatch_tk(i, width)
         self.swatch_canvas.delete("all")
-        w = self.swatch_canvas.winfo_width()
         self.swatch_canvas.create_image(10, 10, anchor="nw", image=self.current_swatch_tk)
         self.swatch_canvas.config(height=60)
 
-        # RGB list
-        self.txt_rgb.config(state="normal")
-        self.txt_rgb.delete("1.0", tk.END)
-        self.txt_rgb.insert(tk.END, format_rgb_list(h["colorsRGB"]))
-        self.txt_rgb.config(state="disabled")
+        # RGB list: jump to the hue's pre-filled block
+        first, last = self._rgb_block_lines[i], self._rgb_block_lines[i + 1] - 1
+        self.txt_rgb.tag_remove("current", "1.0", tk.END)
+        self.txt_rgb.tag_add("current", f"{first}.0", f"{last}.0")
+        self.txt_rgb.yview(f"{first}.0")
+
+    def _make_swatch_tk(self, idx, width):
+        """Render the swatch for hue `idx` at `width`; memoized per instance."""
+        return make_swatch_image(self.hues.rgb[idx], width=width, height=40)
 
     def export_csv(self):
         if not self.hues:
@@ -261,18 +570,8 @@ class HuesApp(tk.Tk):
         if not path:
             return
         try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                # header: index, name, start, end, then 32 RGB triplets flattened
-                header = ["index", "name", "start", "end"]
-                for i in range(32):
-                    header += [f"c{i}_R", f"c{i}_G", f"c{i}_B"]
-                writer.writerow(header)
-                for h in self.hues:
-                    row = [h["index"], h["name"], h["start"], h["end"]]
-                    for (r, g, b) in h["colorsRGB"]:
-                        row += [r, g, b]
-                    writer.writerow(row)
+            # Format the whole table in memory, then copy it out in one go
+            write_file_mapped(path, csv_text(self.hues).encode("utf-8"))
             messagebox.showinfo("Export", f"Saved: {path}")
         except Exception as e:
             messagebox.showerror("Export error", f"Could not save CSV:\n{e}")